@@ -1,10 +1,16 @@
 
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import matplotlib
 matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 try:
@@ -24,22 +30,377 @@ def warn(msg: str):
 def error(msg: str):
     messagebox.showerror("Error", msg)
 
-def draw_chart(parent, fig):
-    for w in parent.winfo_children():
-        w.destroy()
-    canvas = FigureCanvasTkAgg(fig, master=parent)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True)
-
-def clear_frame(frame: ctk.CTkFrame):
-    for w in frame.winfo_children():
-        w.destroy()
-
-def df_head_to_text(df, n=50):
-
-    with pd.option_context("display.max_columns", None, "display.width", 1000):
-        return df.head(n).to_string(index=False)
-
+class ChartPanel:
+    """
+    Figura y canvas de larga vida para un contenedor. Se crean una sola vez y
+    cada refresco actualiza los artistas existentes (alturas de barras, bins del
+    histograma, textos) y redibuja con draw_idle(). Si cambia la forma del gráfico
+    (otro número de barras, pasar de mensaje a datos) se limpia el eje, no la figura.
+    La figura es un Figure suelto, no de pyplot: pyplot no la retiene y se libera
+    con close().
+    """
+
+    def __init__(self, parent, figsize=(4.5, 2.7)):
+        self.figure = Figure(figsize=figsize)
+        self.ax = self.figure.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._kind = None  # "bar", "barh", "hist" o "message"
+        self._bars = []
+        self._text = None
+
+    def _reset(self, kind):
+        self.ax.clear()
+        self.ax.set_axis_on()
+        self._kind = kind
+        self._bars = []
+        self._text = None
+
+    def _redraw(self, layout: bool):
+        if layout:
+            # tight_layout es lo más caro: solo cuando cambian los textos o la forma
+            self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def bar(self, labels, values, title="", ylabel="", horizontal=False, rotation=0):
+        labels = [str(v) for v in labels]
+        values = [float(v) for v in values]
+        kind = "barh" if horizontal else "bar"
+        same_shape = self._kind == kind and len(self._bars) == len(values)
+        if not same_shape:
+            self._reset(kind)
+            pos = range(len(values))
+            self._bars = list(self.ax.barh(pos, values) if horizontal else self.ax.bar(pos, values))
+        else:
+            for rect, v in zip(self._bars, values):
+                if horizontal:
+                    rect.set_width(v)
+                else:
+                    rect.set_height(v)
+            self.ax.relim()
+            self.ax.autoscale_view()
+
+        axis = self.ax.yaxis if horizontal else self.ax.xaxis
+        old_labels = [t.get_text() for t in axis.get_ticklabels()]
+        axis.set_ticks(range(len(labels)), labels)
+        if not horizontal and rotation:
+            self.ax.tick_params(axis="x", rotation=rotation)
+        changed = (not same_shape or old_labels != labels or self.ax.get_title() != title
+                   or self.ax.get_ylabel() != ylabel)
+        self.ax.set_title(title)
+        self.ax.set_ylabel(ylabel)
+        self._redraw(layout=changed)
+
+    def hist(self, counts, edges, title=""):
+        """Dibuja un histograma ya calculado (np.histogram): counts y bordes de los bins."""
+        counts = np.asarray(counts, dtype=float)
+        edges = np.asarray(edges, dtype=float)
+        same_shape = self._kind == "hist" and len(self._bars) == len(counts)
+        if not same_shape:
+            self._reset("hist")
+            self._bars = list(self.ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge"))
+        else:
+            for rect, x, w, c in zip(self._bars, edges[:-1], np.diff(edges), counts):
+                rect.set_x(x)
+                rect.set_width(w)
+                rect.set_height(c)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        changed = not same_shape or self.ax.get_title() != title
+        self.ax.set_title(title)
+        self._redraw(layout=changed)
+
+    def message(self, text: str):
+        if self._kind == "message" and self._text is not None and self._text.get_text() == text:
+            return
+        self._reset("message")
+        self._text = self.ax.text(0.5, 0.5, text, ha="center", va="center")
+        self.ax.set_axis_off()
+        self._redraw(layout=False)
+
+    def close(self):
+        self.canvas.get_tk_widget().destroy()
+        self.figure.clear()
+
+# cada cuánto se revisan los trabajos en segundo plano desde el hilo de Tk
+POLL_MS = 100
+
+
+class JobCancelled(Exception):
+    """El trabajo se canceló o lo reemplazó uno más nuevo."""
+
+
+class Job:
+    """
+    Trabajo en segundo plano del Dashboard. La función de trabajo recibe el Job
+    y llama a report() entre pasos: así publica su avance y se detiene con
+    JobCancelled si se canceló (un hilo no se puede interrumpir desde fuera).
+    """
+
+    def __init__(self, key: str, label: str, on_done, on_error=None):
+        self.key = key
+        self.label = label
+        self.on_done = on_done
+        self.on_error = on_error
+        self.progress = None  # fracción 0-1, o None si no se conoce el total
+        self.message = ""
+        self.future = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def report(self, progress=None, message=None):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+
+
+class DataGrid(ctk.CTkFrame):
+    """
+    Tabla virtualizada sobre un DataFrame: el Treeview solo tiene las filas de la
+    ventana visible y se rellenan con df.iloc al desplazarse. El orden y el filtro
+    son arrays de posiciones calculados una vez (el orden por columna se guarda),
+    así ordenar, filtrar o recorrer millones de filas no copia el DataFrame ni
+    construye textos enormes.
+    """
+
+    ROW_HEIGHT = 22
+    ALL_COLUMNS = "(todas)"
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.df = None
+        self._rows = np.arange(0)   # posiciones del subconjunto mostrado (p. ej. duplicados)
+        self._order = None          # orden actual, como posiciones dentro de _rows
+        self._mask = None           # filtro actual sobre _rows, o None
+        self._view = np.arange(0)   # posiciones finales en df, en orden de pantalla
+        self._sorts = {}            # (columna, ascendente) -> orden
+        self._sort_key = None
+        self._first = 0
+        self._visible = 20
+
+        bar = ctk.CTkFrame(self)
+        bar.pack(fill="x", pady=(0, 5))
+        self.filter_var = tk.StringVar()
+        entry = ctk.CTkEntry(bar, textvariable=self.filter_var, placeholder_text="Filtrar (contiene)", width=220)
+        entry.pack(side="left", padx=5)
+        entry.bind("<Return>", lambda e: self.apply_filter())
+        self.filter_col = tk.StringVar(value=self.ALL_COLUMNS)
+        self.filter_menu = ctk.CTkOptionMenu(bar, values=[self.ALL_COLUMNS], variable=self.filter_col, width=160)
+        self.filter_menu.pack(side="left", padx=5)
+        ctk.CTkButton(bar, text="Filtrar", width=70, command=self.apply_filter).pack(side="left", padx=5)
+        ctk.CTkButton(bar, text="Quitar filtro", width=90, command=self.clear_filter).pack(side="left", padx=5)
+        self.position_label = ctk.CTkLabel(bar, text="")
+        self.position_label.pack(side="right", padx=10)
+
+        body = ctk.CTkFrame(self)
+        body.pack(fill="both", expand=True)
+        ttk.Style(self).configure("Grid.Treeview", rowheight=self.ROW_HEIGHT)
+        self.tree = ttk.Treeview(body, show="headings", style="Grid.Treeview", selectmode="extended")
+        # la barra vertical recorre el total de filas, no los ítems del Treeview
+        self.vbar = ttk.Scrollbar(body, orient="vertical", command=self._on_scrollbar)
+        hbar = ttk.Scrollbar(body, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=hbar.set)
+        self.vbar.pack(side="right", fill="y")
+        hbar.pack(side="bottom", fill="x")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-self._visible))
+        self.tree.bind("<Next>", lambda e: self.scroll(self._visible))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(len(self._view)))
+
+    def set_data(self, df, rows=None):
+        """
+        Muestra 'df', o solo las posiciones 'rows' (en ese orden) si se pasan.
+        Reinicia el orden, el filtro y las órdenes guardadas.
+        """
+        self.df = df
+        self._rows = np.arange(0) if df is None else (
+            np.arange(len(df)) if rows is None else np.asarray(rows, dtype=np.int64))
+        self._order = None
+        self._mask = None
+        self._sorts = {}
+        self._sort_key = None
+        self._first = 0
+
+        columns = [] if df is None else [str(c) for c in df.columns]
+        self.tree.delete(*self.tree.get_children())
+        self.tree.configure(columns=columns)
+        for i, c in enumerate(columns):
+            self.tree.heading(c, text=c, command=lambda i=i: self.sort_by(i))
+            self.tree.column(c, width=120, stretch=False)
+        self.filter_menu.configure(values=[self.ALL_COLUMNS] + columns)
+        self.filter_col.set(self.ALL_COLUMNS)
+        self._update_view()
+
+    def _column(self, i) -> pd.Series:
+        # columna restringida al subconjunto, con índice posicional 0..n-1
+        return self.df.iloc[self._rows, i].reset_index(drop=True)
+
+    def sort_by(self, i):
+        """Ordena por la columna i; un segundo clic invierte el orden. Los nulos van al final."""
+        ascending = self._sort_key != (i, True)
+        key = (i, ascending)
+        if key not in self._sorts:
+            s = self._column(i)
+            try:
+                order = s.sort_values(ascending=ascending, kind="stable", na_position="last")
+            except TypeError:
+                # columna object con tipos mezclados: se ordena por su texto
+                order = s.where(s.isna(), s.astype(str)).sort_values(
+                    ascending=ascending, kind="stable", na_position="last")
+            self._sorts[key] = order.index.values
+        self._order = self._sorts[key]
+        self._sort_key = key
+        for j, c in enumerate(self.tree["columns"]):
+            arrow = (" ▲" if ascending else " ▼") if j == i else ""
+            self.tree.heading(c, text=c + arrow)
+        self._update_view()
+
+    def apply_filter(self):
+        """Deja solo las filas cuyo texto contiene el filtro (en la columna elegida o en cualquiera)."""
+        q = self.filter_var.get().strip()
+        if self.df is None or not q:
+            self.clear_filter()
+            return
+        col = self.filter_col.get()
+        positions = range(self.df.shape[1]) if col == self.ALL_COLUMNS else [list(self.tree["columns"]).index(col)]
+        mask = np.zeros(len(self._rows), dtype=bool)
+        for i in positions:
+            s = self._column(i)
+            mask |= s.astype(str).str.contains(q, case=False, regex=False).values & s.notna().values
+        self._mask = mask
+        self._first = 0
+        self._update_view()
+
+    def clear_filter(self):
+        self.filter_var.set("")
+        self._mask = None
+        self._update_view()
+
+    def _update_view(self):
+        order = np.arange(len(self._rows)) if self._order is None else self._order
+        if self._mask is not None:
+            order = order[self._mask[order]]
+        self._view = self._rows[order]
+        self._render()
+
+    def scroll(self, rows: int):
+        self.scroll_to(self._first + rows)
+        return "break"
+
+    def scroll_to(self, first: int):
+        self._first = max(0, min(int(first), len(self._view) - self._visible))
+        self._render()
+        return "break"
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * len(self._view))
+        elif action == "scroll":
+            self.scroll(int(value) * (self._visible if unit == "pages" else 1))
+
+    def _on_resize(self, event):
+        visible = max(1, (event.height - self.ROW_HEIGHT) // self.ROW_HEIGHT)
+        if visible != self._visible:
+            self._visible = visible
+            self.scroll_to(self._first)
+
+    def _render(self):
+        total = len(self._view)
+        self._first = max(0, min(self._first, total - self._visible))
+        window = self._view[self._first:self._first + self._visible]
+        block = self.df.iloc[window] if len(window) else None
+
+        # se reutilizan los ítems del Treeview: solo se crean o borran los que sobran o faltan
+        items = self.tree.get_children()
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+            items = items[:len(window)]
+        items = list(items) + [self.tree.insert("", "end") for _ in range(len(window) - len(items))]
+        if block is not None:
+            values = block.astype(object).where(block.notna(), "").values.tolist()
+            for iid, row in zip(items, values):
+                self.tree.item(iid, values=[str(v) for v in row])
+
+        if total:
+            self.vbar.set(self._first / total, (self._first + len(window)) / total)
+            self.position_label.configure(
+                text=f"Filas {self._first + 1:,}-{self._first + len(window):,} de {total:,}".replace(",", "."))
+        else:
+            self.vbar.set(0, 1)
+            self.position_label.configure(text="Sin filas")
+
+
+
+class DatasetProfile:
+    """
+    Estadísticas de un DataFrame calculadas una sola vez y compartidas por todas
+    las páginas del Dashboard: nulos por columna y por fila, duplicados (IndiceFilas),
+    dtypes, resumen de columnas numéricas y memoria.
+    """
+
+    # bins de los histogramas precalculados
+    BINS = 30
+
+    def __init__(self, df, report=None):
+        """- report: Job.report opcional, para publicar avance y permitir cancelar"""
+        from Depurador import Histograma, IndiceFilas
+
+        report = report or (lambda *a: None)
+        self.rows, self.cols = df.shape
+        report(0.0, "nulos")
+        # una sola pasada de isna(): de ella salen los conteos por columna y la máscara por fila
+        nulls = df.isna()
+        self.null_counts = nulls.sum()
+        self.null_rows = nulls.any(axis=1).values
+        self.n_null_rows = int(self.null_rows.sum())
+        self.n_missing = int(self.null_counts.sum())
+        del nulls
+
+        report(0.3, "duplicados")
+        self.index = IndiceFilas(df)
+        self.duplicate_mask = self.index.duplicadas(keep="first")
+        self.n_duplicates = self.index.n_duplicados
+
+        self.dtypes = df.dtypes
+        self.dtype_counts = self.dtypes.astype(str).value_counts()
+
+        report(0.5, "resumen numérico")
+        self.numeric_cols = df.select_dtypes(include="number").columns.tolist()
+        num = df[self.numeric_cols]
+        self.numeric_summary = pd.DataFrame({
+            "count": num.count(), "mean": num.mean(), "std": num.std(ddof=0),
+            "min": num.min(), "max": num.max(),
+        })
+
+        # histogramas por columna numérica, con el rango ya conocido por el resumen:
+        # al cambiar de columna en el Dashboard se redibujan sin volver a recorrer los datos
+        self.histograms = {}
+        for i, c in enumerate(self.numeric_cols):
+            report(0.6 + 0.2 * i / len(self.numeric_cols), f"histograma {c}")
+            mn, mx = self.numeric_summary.loc[c, ["min", "max"]]
+            if not (pd.notna(mn) and pd.notna(mx) and np.isfinite([mn, mx]).all()):
+                # hay ±inf (o solo nulos): de_serie toma el rango de los valores finitos
+                mn = mx = None
+            self.histograms[c] = Histograma.de_serie(df[c], self.BINS, minimo=mn, maximo=mx)
+
+        report(0.8, "memoria")
+        self.memory_bytes = int(df.memory_usage(deep=True).sum())
+        report(1.0, "")
 
 
 class DataDebuggerApp(ctk.CTk):
@@ -51,8 +412,22 @@ class DataDebuggerApp(ctk.CTk):
         ctk.set_appearance_mode("system")
         ctk.set_default_color_theme("dark-blue")
 
-        self.df = None         
-        self.last_file = None   
+        self._fechas_lock = threading.Lock()  # la caché de fechas también se usa desde el pool
+        self.df = None          # el setter también reinicia las cachés derivadas
+        self.last_file = None
+
+        # trabajos en segundo plano: uno vigente por clave (página, carga, migración)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard")
+        self._jobs = {}
+        self._poll_id = None
+        self._pending_render = None
+        # cerrar con la X también cancela los trabajos; si no, el proceso no termina
+        # hasta que el pool acabe (p. ej. una migración en curso)
+        self.protocol("WM_DELETE_WINDOW", self.on_exit)
+
+        self._charts = {}  # contenedor -> ChartPanel
+        # con DEPURADOR_MEDIR=1 (o app.py --medir) se imprime cuánto tarda cada refresco del Dashboard
+        self.measure_refresh = bool(os.environ.get("DEPURADOR_MEDIR"))
 
  
         self._build_sidebar()
@@ -66,6 +441,140 @@ class DataDebuggerApp(ctk.CTk):
         self.show_page("Dashboard")
 
 
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        # cualquier dato derivado de self.df queda invalidado al cambiar el dataset
+        with self._fechas_lock:
+            self._df = value
+            self._fechas = {}  # columna -> serie de fechas ya parseada
+        self._profile = None  # DatasetProfile, calculado una vez por dataset
+
+    @property
+    def profile(self):
+        """DatasetProfile de self.df; si aún no está calculado, se calcula en el hilo que lo pida."""
+        if self._profile is None and self._df is not None and pd is not None:
+            self._profile = DatasetProfile(self._df)
+        return self._profile
+
+    def set_dataset(self, df, profile=None):
+        """Asigna el dataset con un perfil ya calculado (p. ej. en un trabajo en segundo plano)."""
+        self.df = df
+        self._profile = profile
+
+    def run_job(self, key: str, label: str, work, on_done, on_error=None) -> Job:
+        """
+        Ejecuta work(job) fuera del hilo de Tk y luego on_done(resultado) en el hilo de Tk.
+        Un trabajo nuevo con la misma 'key' cancela y reemplaza al anterior en vez de
+        esperar detrás de él; el resultado del reemplazado se descarta.
+        """
+        old = self._jobs.pop(key, None)
+        if old is not None:
+            old.cancel()
+        job = Job(key, label, on_done, on_error)
+        job.future = self._executor.submit(work, job)
+        self._jobs[key] = job
+        self._show_progress()
+        if self._poll_id is None:
+            self._poll_id = self.after(POLL_MS, self._poll_jobs)
+        return job
+
+    def _poll_jobs(self):
+        self._poll_id = None
+        for key, job in list(self._jobs.items()):
+            if not job.future.done():
+                continue
+            del self._jobs[key]
+            exc = job.future.exception()
+            if job.cancelled or isinstance(exc, JobCancelled):
+                continue
+            if exc is not None:
+                if job.on_error is not None:
+                    job.on_error(exc)
+                else:
+                    error(f"{job.label}:\n{exc}")
+            else:
+                job.on_done(job.future.result())
+        self._show_progress()
+        if self._jobs:
+            self._poll_id = self.after(POLL_MS, self._poll_jobs)
+
+    def _show_progress(self):
+        if not self._jobs:
+            self.progress_bar.set(0)
+            self.status_label.configure(text="")
+            self.cancel_button.configure(state="disabled")
+            return
+        job = list(self._jobs.values())[-1]
+        self.progress_bar.set(job.progress or 0)
+        text = f"{job.label}: {job.message}" if job.message else job.label
+        if len(self._jobs) > 1:
+            text += f" ({len(self._jobs) - 1} más)"
+        self.status_label.configure(text=text)
+        self.cancel_button.configure(state="normal")
+
+    def cancel_jobs(self):
+        for job in self._jobs.values():
+            job.cancel()
+        self._jobs.clear()
+        self._pending_render = None
+        self._show_progress()
+
+    def _with_profile(self, render):
+        """Llama a render() cuando el perfil de self.df esté listo, calculándolo fuera del hilo de Tk."""
+        if self._df is None or pd is None or self._profile is not None:
+            render()
+            return
+        # si se piden varias páginas mientras se calcula, se pinta solo la última
+        self._pending_render = render
+        df = self._df
+        running = self._jobs.get("perfil")
+        if running is not None and running.df is df:
+            return
+
+        def done(profile):
+            if self._df is df:
+                self._profile = profile
+                pending, self._pending_render = self._pending_render, None
+                if pending is not None:
+                    pending()
+
+        job = self.run_job("perfil", "Perfil del dataset", lambda j: DatasetProfile(df, j.report), done)
+        job.df = df
+
+    def chart_panel(self, container, figsize=(4.5, 2.7)) -> ChartPanel:
+        """ChartPanel del contenedor; se crea la primera vez y luego se reutiliza."""
+        panel = self._charts.get(container)
+        if panel is None:
+            panel = self._charts[container] = ChartPanel(container, figsize)
+        return panel
+
+    @property
+    def indice_filas(self):
+        """Hashes de fila de self.df, calculados una sola vez por dataset."""
+        return self.profile.index
+
+    def fechas_parseadas(self, col, df=None):
+        """
+        Serie de fechas parseada para la columna 'col', calculada una sola vez por dataset.
+        - df: el DataFrame con el que trabaja un hilo del pool; si ya no es self.df,
+          se parsea sin guardarlo en la caché
+        """
+        from Depurador import parsear_fechas
+        df = self._df if df is None else df
+        with self._fechas_lock:
+            if df is self._df and col in self._fechas:
+                return self._fechas[col]
+        # el parseo va fuera del lock: no bloquea al hilo de Tk si cambia el dataset
+        parsed = parsear_fechas(df[col])
+        with self._fechas_lock:
+            if df is self._df:
+                self._fechas[col] = parsed
+        return parsed
+
     def _build_sidebar(self):
         self.sidebar = ctk.CTkFrame(self, width=220, corner_radius=0)
         self.sidebar.pack(side="left", fill="y")
@@ -124,6 +633,16 @@ class DataDebuggerApp(ctk.CTk):
 
         ctk.CTkLabel(self.header, text="Usuario (Admin)").pack(side="right", padx=20)
 
+        # avance del trabajo en segundo plano más reciente
+        self.cancel_button = ctk.CTkButton(self.header, text="✖ Cancelar", width=90,
+                                           state="disabled", command=self.cancel_jobs)
+        self.cancel_button.pack(side="right", padx=5)
+        self.progress_bar = ctk.CTkProgressBar(self.header, width=160)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side="right", padx=5)
+        self.status_label = ctk.CTkLabel(self.header, text="")
+        self.status_label.pack(side="right", padx=5)
+
 
         self.content = ctk.CTkFrame(self.main)
         self.content.pack(expand=True, fill="both", padx=10, pady=(0, 10))
@@ -169,10 +688,17 @@ class DataDebuggerApp(ctk.CTk):
         url = self.entry_src.get().strip()
         if not (url.startswith("mysql+") or url.startswith("oracle+")):
             error("Solo se permiten conexiones MySQL u Oracle.")
-        return
-    try:
-        from db_io import read_dataframe_from_db
-        df = read_dataframe_from_db(url, limit=5)
+            return
+
+        def work(job):
+            from db_io import read_dataframe_from_db
+            job.report(None, "conectando")
+            return read_dataframe_from_db(url, limit=5)
+
+        self.run_job("conexion", "Probando conexión", work, lambda df: self._on_src_sample(url, df),
+                     on_error=lambda e: error(f"No se pudo conectar:\n{e}"))
+
+    def _on_src_sample(self, url, df):
         if df is not None:
             info(f"Conexión OK. Se leyeron {len(df)} filas de muestra.")
         else:
@@ -181,24 +707,29 @@ class DataDebuggerApp(ctk.CTk):
         self.df = df  # Esto permite usar el DataFrame en el Dashboard
         self.last_file = url
         self.show_page("Dashboard")
-    except Exception as e:
-        error(f"No se pudo conectar:\n{e}")
-
-def do_migration(self):
-    src = self.entry_src.get().strip()
-    dst = self.entry_dst.get().strip()
-    if not (src.startswith(("mysql+", "oracle+")) and dst.startswith(("mysql+", "oracle+"))):
-        error("Origen y destino deben ser MySQL u Oracle.")
-        return
-    try:
-        from db_io import read_dataframe_from_db
-        from sqlalchemy import create_engine
-        df = read_dataframe_from_db(src)
-        eng = create_engine(dst)
-        df.to_sql("tabla_migrada", eng, if_exists="replace", index=False)
-        info("Migración completada. Tabla: tabla_migrada")
-    except Exception as e:
-        error(f"Error en la migración:\n{e}")
+
+    def do_migration(self):
+        src = self.entry_src.get().strip()
+        dst = self.entry_dst.get().strip()
+        if not (src.startswith(("mysql+", "oracle+")) and dst.startswith(("mysql+", "oracle+"))):
+            error("Origen y destino deben ser MySQL u Oracle.")
+            return
+
+        def work(job):
+            from db_io import migrate_table
+            # si una migración anterior se cortó (o se canceló), se reanuda desde el último lote confirmado
+            checkpoint = os.path.join(tempfile.gettempdir(), "migracion_tabla_migrada.json")
+            return migrate_table(src, dst, dest_table="tabla_migrada", checkpoint=checkpoint,
+                                 on_progress=lambda rows, rate: job.report(
+                                     None, f"{rows:,} filas ({rate:,.0f}/s)".replace(",", ".")))
+
+        self.run_job("migracion", "Migración", work, self._on_migrated,
+                     on_error=lambda e: error(f"Error en la migración:\n{e}"))
+
+    def _on_migrated(self, res):
+        info(f"Migración completada. Tabla: tabla_migrada\n"
+             f"Filas: {res['rows']:,} en {res['seconds']:.1f} s "
+             f"({res['rows_per_s']:,.0f} filas/s)".replace(",", "."))
 
 
 
@@ -225,6 +756,16 @@ def do_migration(self):
 
 
     def on_exit(self):
+        self.cancel_jobs()
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for panel in self._charts.values():
+            panel.close()
+        self._charts.clear()
+        if "db_io" in sys.modules:
+            sys.modules["db_io"].dispose_all_engines()
         self.destroy()
 
     def apply_search(self):
@@ -253,15 +794,21 @@ def do_migration(self):
         )
         if not path:
             return
-        try:
-            df = pd.read_csv(path, encoding="utf-8")
-        except UnicodeDecodeError:
-            df = pd.read_csv(path, encoding="latin-1")
-        except Exception as e:
-            error(f"No se pudo leer el archivo:\n{e}")
-            return
+        backend = "pyarrow" if self.arrow_var.get() else None
 
-        self.df = df
+        def work(job):
+            from Depurador import leer_csv
+            job.report(None, "leyendo")
+            df = leer_csv(path, dtype_backend=backend)
+            job.report(None, "perfil")
+            return df, DatasetProfile(df, job.report)
+
+        self.run_job("carga", f"Cargando {os.path.basename(path)}", work,
+                     lambda res: self._on_loaded(path, *res),
+                     on_error=lambda e: error(f"No se pudo leer el archivo:\n{e}"))
+
+    def _on_loaded(self, path, df, profile):
+        self.set_dataset(df, profile)
         self.last_file = path
         info(f"Archivo cargado:\n{path}\nFilas: {len(df)}, Columnas: {len(df.columns)}")
         current = self.get_current_page_name() or "Dashboard"
@@ -293,6 +840,11 @@ def do_migration(self):
 
         self.chart2_container = ctk.CTkFrame(self.charts_row1)
         self.chart2_container.pack(side="left", padx=10, pady=10, fill="both", expand=True)
+        # columna del histograma; se redibuja desde los conteos del perfil
+        self.hist_col_var = tk.StringVar(value="")
+        self.hist_menu = ctk.CTkOptionMenu(self.chart2_container, values=[""], variable=self.hist_col_var,
+                                           command=lambda col: self.draw_histogram())
+        self.hist_menu.pack(anchor="ne", padx=5, pady=(5, 0))
 
         self.charts_row2 = ctk.CTkFrame(frame)
         self.charts_row2.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -314,6 +866,10 @@ def do_migration(self):
         )
 
     def refresh_dashboard(self):
+        self._with_profile(self._render_dashboard)
+
+    def _render_dashboard(self):
+        t0 = time.perf_counter()
 
         if self.df is None or pd is None:
 
@@ -325,10 +881,11 @@ def do_migration(self):
             ]
             data_for_plots = None
         else:
-            total_rows = len(self.df)
-            total_cols = len(self.df.columns)
-            missing = int(self.df.isna().sum().sum())
-            dups = int(self.df.duplicated().sum())
+            prof = self.profile
+            total_rows = prof.rows
+            total_cols = prof.cols
+            missing = prof.n_missing
+            dups = prof.n_duplicates
             totals = [
                 ("Total de filas", f"{total_rows:,}".replace(",", ".")),
                 ("Total de columnas", f"{total_cols:,}".replace(",", ".")),
@@ -346,109 +903,127 @@ def do_migration(self):
 
         if data_for_plots:
 
-            nulls = self.df.isna().mean().sort_values(ascending=False) * 100
+            nulls = (prof.null_counts / max(1, prof.rows)).sort_values(ascending=False) * 100
             nulls = nulls[nulls > 0].head(10)
-            fig1, ax1 = plt.subplots(figsize=(4.5, 2.7))
+            panel = self.chart_panel(self.chart1_container)
             if len(nulls) > 0:
-                ax1.bar(nulls.index.astype(str), nulls.values)
-                ax1.set_ylabel("% nulos")
-                ax1.set_title("Top 10 columnas con nulos")
-                ax1.tick_params(axis='x', rotation=30)
-            else:
-                ax1.text(0.5, 0.5, "Sin valores nulos", ha="center", va="center")
-                ax1.set_axis_off()
-            fig1.tight_layout()
-            draw_chart(self.chart1_container, fig1)
-
-
-            num_cols = self.df.select_dtypes(include="number").columns.tolist()
-            fig2, ax2 = plt.subplots(figsize=(4.5, 2.7))
-            if num_cols:
-                col = num_cols[0]
-                ax2.hist(self.df[col].dropna(), bins=30)
-                ax2.set_title(f"Histograma: {col}")
+                panel.bar(nulls.index, nulls.values, title="Top 10 columnas con nulos",
+                          ylabel="% nulos", rotation=30)
             else:
-                ax2.text(0.5, 0.5, "No hay columnas numéricas", ha="center", va="center")
-                ax2.set_axis_off()
-            fig2.tight_layout()
-            draw_chart(self.chart2_container, fig2)
+                panel.message("Sin valores nulos")
 
 
-            dtypes = self.df.dtypes.astype(str).value_counts()
-            fig3, ax3 = plt.subplots(figsize=(4.5, 2.7))
+            num_cols = [str(c) for c in prof.numeric_cols]
+            self.hist_menu.configure(values=num_cols or [""])
+            if self.hist_col_var.get() not in num_cols:
+                self.hist_col_var.set(num_cols[0] if num_cols else "")
+            self.draw_histogram()
+
+
+            dtypes = prof.dtype_counts
+            panel = self.chart_panel(self.chart3_container)
             if len(dtypes) > 0:
-                ax3.barh(dtypes.index, dtypes.values)
-                ax3.set_title("Tipos de datos")
+                panel.bar(dtypes.index, dtypes.values, title="Tipos de datos", horizontal=True)
             else:
-                ax3.text(0.5, 0.5, "Sin columnas", ha="center", va="center")
-                ax3.set_axis_off()
-            fig3.tight_layout()
-            draw_chart(self.chart3_container, fig3)
-
-
-            fig4, ax4 = plt.subplots(figsize=(4.5, 2.7))
-            if self.df is not None:
-                clean_rows = int((~self.df.isna().any(axis=1)).sum())
-                dirty_rows = int((self.df.isna().any(axis=1)).sum())
-                ax4.bar(["Limpias", "Con nulos"], [clean_rows, dirty_rows])
-                ax4.set_title("Filas limpias vs con nulos")
-            fig4.tight_layout()
-            draw_chart(self.chart4_container, fig4)
-
-
-            fig5, ax5 = plt.subplots(figsize=(4.5, 2.7))
-            if self.df is not None:
-                dup_count = int(self.df.duplicated().sum())
-                non_dup = len(self.df) - dup_count
-                ax5.bar(["Únicas", "Duplicadas"], [non_dup, dup_count])
-                ax5.set_title("Filas únicas vs duplicadas")
-            fig5.tight_layout()
-            draw_chart(self.chart5_container, fig5)
+                panel.message("Sin columnas")
+
+
+            clean_rows = prof.rows - prof.n_null_rows
+            dirty_rows = prof.n_null_rows
+            self.chart_panel(self.chart4_container).bar(
+                ["Limpias", "Con nulos"], [clean_rows, dirty_rows], title="Filas limpias vs con nulos")
+
+
+            dup_count = prof.n_duplicates
+            non_dup = prof.rows - dup_count
+            self.chart_panel(self.chart5_container).bar(
+                ["Únicas", "Duplicadas"], [non_dup, dup_count], title="Filas únicas vs duplicadas")
         else:
 
             for cont in [self.chart1_container, self.chart2_container, self.chart3_container,
                          self.chart4_container, self.chart5_container]:
-                clear_frame(cont)
+                self.chart_panel(cont).message("Sin datos")
 
+        if self.measure_refresh:
+            print(f"refresh_dashboard: {(time.perf_counter() - t0) * 1000:.1f} ms", file=sys.stderr)
+
+
+    def draw_histogram(self):
+        """Histograma de la columna elegida, a partir de los conteos ya calculados en el perfil."""
+        panel = self.chart_panel(self.chart2_container)
+        # sin perfil todavía (se está calculando) no se calcula aquí, en el hilo de Tk
+        prof = self._profile
+        if prof is None or not prof.numeric_cols:
+            panel.message("No hay columnas numéricas")
+            return
+        col = {str(c): c for c in prof.numeric_cols}.get(self.hist_col_var.get(), prof.numeric_cols[0])
+        h = prof.histograms[col]
+        panel.hist(h.conteos, h.bordes, title=f"Histograma: {col}")
 
     def _build_resumen(self, frame: ctk.CTkFrame):
 
         btns = ctk.CTkFrame(frame)
         btns.pack(fill="x", padx=10, pady=10)
         ctk.CTkButton(btns, text="🔄 Recalcular", command=self.refresh_resumen).pack(side="right", padx=5)
+        ctk.CTkButton(btns, text="🗜️ Compactar memoria", command=self.compact_dataset).pack(side="right", padx=5)
 
 
         self.resumen_text = ctk.CTkTextbox(frame, wrap="none", height=600)
         self.resumen_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_resumen(self):
+        self._with_profile(self._render_resumen)
+
+    def _render_resumen(self):
         self.resumen_text.delete("1.0", "end")
         if self.df is None or pd is None:
             self.resumen_text.insert("end", "Carga un CSV para ver el resumen.\n")
             return
         df = self.df
+        prof = self.profile
         lines = []
         lines.append(f"Archivo: {self.last_file or '(no guardado)'}")
-        lines.append(f"Filas: {len(df):,}".replace(",", "."))
-        lines.append(f"Columnas: {len(df.columns):,}".replace(",", "."))
+        lines.append(f"Filas: {prof.rows:,}".replace(",", "."))
+        lines.append(f"Columnas: {prof.cols:,}".replace(",", "."))
         lines.append("")
         lines.append("Tipos de datos por columna:")
-        lines.append(df.dtypes.to_string())
+        lines.append(prof.dtypes.to_string())
         lines.append("")
-        nulls = df.isna().sum()
-        if nulls.sum() > 0:
+        nulls = prof.null_counts
+        if prof.n_missing > 0:
             lines.append("Valores nulos por columna:")
             lines.append(nulls[nulls > 0].sort_values(ascending=False).to_string())
         else:
             lines.append("No se detectaron valores nulos.")
         lines.append("")
-        try:
-            mem = df.memory_usage(deep=True).sum()
-            lines.append(f"Memoria estimada: {mem/1024/1024:.2f} MB")
-        except Exception:
-            pass
+        lines.append(f"Memoria estimada: {prof.memory_bytes/1024/1024:.2f} MB")
+        compactacion = df.attrs.get("compactacion")
+        if compactacion:
+            ahorro = sum(r["antes"] - r["despues"] for r in compactacion.values())
+            lines.append(f"Ahorro por compactación: {ahorro/1024/1024:.2f} MB")
+            for col, r in sorted(compactacion.items(), key=lambda kv: kv[1]["despues"] - kv[1]["antes"]):
+                lines.append(f"  {col}: {r['accion']}, {(r['antes'] - r['despues'])/1024:,.1f} KB menos "
+                             f"({r['antes']/1024:,.1f} -> {r['despues']/1024:,.1f} KB)")
         self.resumen_text.insert("end", "\n".join(lines))
 
+    def compact_dataset(self):
+        if self.df is None or pd is None:
+            warn("Primero carga un CSV.")
+            return
+        df = self.df
+
+        def work(job):
+            from Depurador import compactar_dataframe
+            return compactar_dataframe(df)
+
+        def done(compact):
+            # si mientras tanto se cargó otro dataset, el resultado ya no aplica
+            if self._df is df:
+                self.df = compact
+                self.refresh_resumen()
+
+        self.run_job("compactar", "Compactar memoria", work, done)
+
 
     def _build_duplicados(self, frame: ctk.CTkFrame):
         top = ctk.CTkFrame(frame)
@@ -459,55 +1034,86 @@ def do_migration(self):
         ctk.CTkButton(top, text="💾 Exportar sin duplicados",
                       command=self.export_no_duplicates).pack(side="left", padx=5)
 
-        self.dups_text = ctk.CTkTextbox(frame, wrap="none")
-        self.dups_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        ctk.CTkButton(top, text="📄 Ver todos los datos", command=self.show_all_rows).pack(side="left", padx=5)
+
+        self.dups_label = ctk.CTkLabel(frame, text="", anchor="w")
+        self.dups_label.pack(fill="x", padx=10)
+        self.dups_grid = DataGrid(frame)
+        self.dups_grid.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_duplicados(self):
-        self.dups_text.delete("1.0", "end")
+        self._with_profile(self._render_duplicados)
+
+    def _render_duplicados(self):
         if self.df is None or pd is None:
-            self.dups_text.insert("end", "Carga un CSV para analizar duplicados.\n")
+            self.dups_label.configure(text="Carga un CSV para analizar duplicados.")
+            self.dups_grid.set_data(None)
             return
-        dup_count = int(self.df.duplicated().sum())
-        self.dups_text.insert("end", f"Filas duplicadas: {dup_count}\n")
-        self.dups_text.insert("end", "Usa 'Ver duplicados' para mostrar una muestra.\n")
+        dup_count = self.profile.n_duplicates
+        self.dups_label.configure(text=f"Filas duplicadas: {dup_count}. "
+                                       "Usa 'Ver duplicados' para recorrerlas.")
+        if self.dups_grid.df is not self.df:
+            self.dups_grid.set_data(None)
 
     def show_duplicates(self):
         if self.df is None or pd is None:
             warn("Primero carga un CSV.")
             return
-        dups = self.df[self.df.duplicated(keep=False)]
-        self.dups_text.delete("1.0", "end")
-        if dups.empty:
-            self.dups_text.insert("end", "No se encontraron duplicados.\n")
-        else:
-            txt = df_head_to_text(dups)
-            self.dups_text.insert("end", txt + "\n")
+        self._with_profile(self._show_duplicates)
+
+    def _show_duplicates(self):
+        index = self.profile.index
+        rows = np.flatnonzero(index.duplicadas(keep=False))
+        if len(rows) == 0:
+            self.dups_label.configure(text="No se encontraron duplicados.")
+            self.dups_grid.set_data(None)
+            return
+        # ordenadas por hash (estable): las copias de una misma fila quedan juntas
+        rows = rows[np.argsort(index.hashes[rows], kind="stable")]
+        self.dups_label.configure(text=f"Filas involucradas en duplicados: {len(rows):,}".replace(",", "."))
+        self.dups_grid.set_data(self.df, rows)
+
+    def show_all_rows(self):
+        if self.df is None or pd is None:
+            warn("Primero carga un CSV.")
+            return
+        self.dups_label.configure(text=f"Todas las filas: {len(self.df):,}".replace(",", "."))
+        self.dups_grid.set_data(self.df)
 
     def preview_drop_duplicates(self):
         if self.df is None or pd is None:
             warn("Primero carga un CSV.")
             return
-        cleaned = self.df.drop_duplicates()
-        rows_removed = len(self.df) - len(cleaned)
-        info(f"Se eliminarían {rows_removed} filas duplicadas.\n"
-             "Para exportar el resultado usa: 'Exportar sin duplicados'.")
+        self._with_profile(lambda: info(
+            f"Se eliminarían {self.profile.n_duplicates} filas duplicadas.\n"
+            "Para exportar el resultado usa: 'Exportar sin duplicados'."))
 
     def export_no_duplicates(self):
         if self.df is None or pd is None:
             warn("Primero carga un CSV.")
             return
-        cleaned = self.df.drop_duplicates()
         path = filedialog.asksaveasfilename(
             defaultextension=".csv", filetypes=[("CSV", "*.csv")],
             title="Guardar CSV sin duplicados"
         )
         if not path:
             return
-        try:
-            cleaned.to_csv(path, index=False, encoding="utf-8")
-            info(f"Archivo guardado en:\n{path}")
-        except Exception as e:
-            error(f"No se pudo guardar el archivo:\n{e}")
+        df = self.df
+
+        def save():
+            index = self.indice_filas
+
+            def work(job):
+                job.report(None, "escribiendo CSV")
+                index.sin_duplicados(df).to_csv(path, index=False, encoding="utf-8")
+                return path
+
+            self.run_job("exportar", "Exportar sin duplicados", work,
+                         lambda p: info(f"Archivo guardado en:\n{p}"),
+                         on_error=lambda e: error(f"No se pudo guardar el archivo:\n{e}"))
+
+        # los hashes de fila salen del perfil, que se calcula fuera del hilo de Tk
+        self._with_profile(lambda: save() if self._df is df else None)
 
 
     def _build_inconsistentes(self, frame: ctk.CTkFrame):
@@ -528,14 +1134,25 @@ def do_migration(self):
         q = (self.search_var.get() or "").strip().lower()
         cols = df.columns
         if q:
-            cols = [c for c in cols if q in c.lower()] or df.columns
+            cols = [c for c in cols if q in str(c).lower()] or df.columns
+
+        self.incons_text.insert("end", "Analizando...\n")
+        self.run_job("Datos Inconsistentes", "Inconsistencias",
+                     lambda job: self._find_inconsistencies(job, df, cols),
+                     self._show_inconsistentes)
 
+    def _find_inconsistencies(self, job, df, cols) -> list:
+        # se ejecuta en un hilo del pool: no toca widgets ni lee self.df, que puede
+        # cambiar mientras tanto; las fechas pasan por fechas_parseadas con ese mismo df
         lines = []
 
-        for c in cols:
+        from Depurador import columnas_texto
+        texto = set(columnas_texto(df))
+        for i, c in enumerate(cols):
+            job.report(0.7 * i / max(1, len(cols)), str(c))
             s = df[c]
 
-            if s.dtype == 'O':
+            if c in texto:
 
                 numeric_coerce = pd.to_numeric(s.replace(r"[,]", ".", regex=True), errors="coerce")
                 non_na = s.notna().sum()
@@ -547,13 +1164,14 @@ def do_migration(self):
                     lines.append(f"[{c}] - Mayormente numérica, pero {bad} valores no numéricos.")
 
 
-        email_like = [c for c in cols if any(k in c.lower() for k in ["mail", "correo", "email"])]
-        phone_like = [c for c in cols if any(k in c.lower() for k in ["tel", "fono", "phone", "cel"])]
+        email_like = [c for c in cols if any(k in str(c).lower() for k in ["mail", "correo", "email"])]
+        phone_like = [c for c in cols if any(k in str(c).lower() for k in ["tel", "fono", "phone", "cel"])]
 
         import re
         email_re = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
         phone_re = re.compile(r"^[\d\-\+\(\)\s]{7,}$")
 
+        job.report(0.7, "correos y teléfonos")
         for c in email_like:
             s = df[c].astype(str).str.strip()
             if s.notna().sum() == 0: 
@@ -571,10 +1189,11 @@ def do_migration(self):
                 lines.append(f"[{c}] - {invalid} teléfonos con formato inválido.")
 
 
-        date_like = [c for c in cols if any(k in c.lower() for k in ["fecha", "date"])]
+        date_like = [c for c in cols if any(k in str(c).lower() for k in ["fecha", "date"])]
+        job.report(0.85, "fechas")
         for c in date_like:
             try:
-                parsed = pd.to_datetime(df[c], errors="coerce", dayfirst=True)
+                parsed = self.fechas_parseadas(c, df)
                 non_na = df[c].notna().sum()
                 bad = non_na - parsed.notna().sum()
                 if bad > 0:
@@ -584,6 +1203,10 @@ def do_migration(self):
 
         if not lines:
             lines.append("No se detectaron inconsistencias básicas con las heurísticas actuales.")
+        return lines
+
+    def _show_inconsistentes(self, lines):
+        self.incons_text.delete("1.0", "end")
         self.incons_text.insert("end", "\n".join(lines) + "\n")
 
 
@@ -596,31 +1219,25 @@ def do_migration(self):
         self.falt_chart_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_faltantes(self):
+        self._with_profile(self._render_faltantes)
+
+    def _render_faltantes(self):
+        panel = self.chart_panel(self.falt_chart_container, figsize=(8, 4))
         if self.df is None or pd is None:
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.text(0.5, 0.5, "Carga un CSV para graficar faltantes.", ha="center", va="center")
-            ax.set_axis_off()
-            fig.tight_layout()
-            draw_chart(self.falt_chart_container, fig)
+            panel.message("Carga un CSV para graficar faltantes.")
             return
 
         df = self.df
         q = (self.search_var.get() or "").strip().lower()
         cols = df.columns
         if q:
-            cols = [c for c in cols if q in c.lower()] or df.columns
-        nulls = df[cols].isna().sum().sort_values(ascending=False)
-        fig, ax = plt.subplots(figsize=(8, 4))
+            cols = [c for c in cols if q in str(c).lower()] or df.columns
+        nulls = self.profile.null_counts[cols].sort_values(ascending=False)
         if nulls.sum() == 0:
-            ax.text(0.5, 0.5, "No hay valores faltantes.", ha="center", va="center")
-            ax.set_axis_off()
+            panel.message("No hay valores faltantes.")
         else:
-            ax.bar(nulls.index.astype(str), nulls.values)
-            ax.set_ylabel("Conteo nulos")
-            ax.set_title("Valores faltantes por columna")
-            ax.tick_params(axis='x', rotation=30)
-        fig.tight_layout()
-        draw_chart(self.falt_chart_container, fig)
+            panel.bar(nulls.index, nulls.values, title="Valores faltantes por columna",
+                      ylabel="Conteo nulos", rotation=30)
 
    
     def _build_erroneos(self, frame: ctk.CTkFrame):
@@ -632,31 +1249,43 @@ def do_migration(self):
         self.err_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_erroneos(self):
+        self._with_profile(self._start_erroneos)
+
+    def _start_erroneos(self):
         self.err_text.delete("1.0", "end")
         if self.df is None or pd is None or np is None:
             self.err_text.insert("end", "Carga un CSV para detectar outliers.\n")
             return
-        df = self.df.select_dtypes(include="number")
-        if df.empty:
+        prof = self.profile
+        if not prof.numeric_cols:
             self.err_text.insert("end", "El dataset no tiene columnas numéricas.\n")
             return
-        lines = []
         q = (self.search_var.get() or "").strip().lower()
-        cols = df.columns
+        cols = prof.numeric_cols
         if q:
-            cols = [c for c in cols if q in c.lower()] or df.columns
-        df = df[cols]
+            cols = [c for c in cols if q in str(c).lower()] or prof.numeric_cols
+        df = self.df
 
-        for c in df.columns:
-            s = df[c].dropna().astype(float)
-            if s.std(ddof=0) == 0:
-                continue
-            z = (s - s.mean()) / s.std(ddof=0)
-            outliers = int((np.abs(z) > 3).sum())
-            if outliers > 0:
-                lines.append(f"[{c}] - {outliers} posibles outliers (|Z|>3)")
-        if not lines:
-            lines.append("No se detectaron outliers con la regla Z>3.")
+        def work(job):
+            lines = []
+            for i, c in enumerate(cols):
+                job.report(i / len(cols), str(c))
+                mean, std = prof.numeric_summary.loc[c, ["mean", "std"]]
+                if not std or pd.isna(std):
+                    continue
+                # |Z| > 3 con la media y la desviación del perfil, sin recalcularlas
+                outliers = int(((df[c].astype(float) - mean).abs() > 3 * std).sum())
+                if outliers > 0:
+                    lines.append(f"[{c}] - {outliers} posibles outliers (|Z|>3)")
+            if not lines:
+                lines.append("No se detectaron outliers con la regla Z>3.")
+            return lines
+
+        self.err_text.insert("end", "Analizando...\n")
+        self.run_job("Datos erróneos", "Outliers", work, self._show_erroneos)
+
+    def _show_erroneos(self, lines):
+        self.err_text.delete("1.0", "end")
         self.err_text.insert("end", "\n".join(lines) + "\n")
 
 
@@ -679,6 +1308,12 @@ def do_migration(self):
         ).pack(side="left", padx=10)
 
 
+        # modo Arrow: las columnas de texto ocupan mucha menos memoria que los str de Python
+        self.arrow_var = tk.BooleanVar(value=False)
+        ctk.CTkSwitch(frame, text="Cargar en modo Arrow (pyarrow)", variable=self.arrow_var).pack(
+            anchor="w", padx=10, pady=(0, 10)
+        )
+
         ctk.CTkButton(frame, text="Restablecer Dashboard (demo)",
                       command=lambda: self.show_page("Dashboard")).pack(padx=10, pady=10, anchor="w")
 
@@ -694,17 +1329,18 @@ def do_migration(self):
 
 
 if __name__ == "__main__":
-    import sys, os
     app = DataDebuggerApp()
 
     try:
         if len(sys.argv) > 1 and os.path.exists(sys.argv[1]):
 
-            import pandas as pd
-            try:
-                df = pd.read_csv(sys.argv[1], encoding="utf-8")
-            except UnicodeDecodeError:
-                df = pd.read_csv(sys.argv[1], encoding="latin-1")
+            if sys.argv[1].lower().endswith((".arrow", ".feather", ".pkl")):
+                # dataset ya depurado que deja Main.py, con sus dtypes
+                from Depurador import cargar_binario
+                df = cargar_binario(sys.argv[1])
+            else:
+                from Depurador import leer_csv
+                df = leer_csv(sys.argv[1])
             app.df = df
             app.last_file = sys.argv[1]
 
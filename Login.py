@@ -4,8 +4,13 @@ from tkinter import messagebox
 import os, sys, subprocess
 
 class LoginWindow:
-    def __init__(self, root):
+    def __init__(self, root, on_login=None):
+        """
+        - on_login: callback sin argumentos al ingresar; si no se pasa, se abre
+          Main.py en un proceso nuevo (ver app.py para el flujo en un solo proceso)
+        """
         self.root = root
+        self.on_login = on_login
         self.root.title("Login")
         self.root.geometry("360x240")
         self.root.configure(bg="#1A1A1A")
@@ -27,6 +32,9 @@ class LoginWindow:
         tk.Button(frm, text="Ingresar", command=self.login).grid(row=2, column=0, columnspan=2, pady=12, ipadx=12)
 
     def login(self):
+        if self.on_login is not None:
+            self.on_login()
+            return
         here = os.path.dirname(os.path.abspath(__file__))
         main_path = os.path.join(here, "Main.py")
         if not os.path.exists(main_path):
@@ -5,12 +5,16 @@ import os
 import sys
 import subprocess
 import tempfile
-import pandas as pd
-from PIL import Image, ImageTk
 
 class DataCleaningApp:
-    def __init__(self, root):
+    def __init__(self, root, on_open=None):
+        """
+        - on_open: callback que recibe el DataFrame depurado y el nombre del origen;
+          si no se pasa, el Dashboard se abre en un proceso nuevo a partir de un
+          archivo temporal
+        """
         self.root = root
+        self.on_open = on_open
         self.root.title("Herramienta de Depuración de Datos")
         self.root.geometry("800x600")
         self.root.tk.call('tk', 'scaling', 1.5)
@@ -18,6 +22,8 @@ class DataCleaningApp:
         self.root.minsize(600, 500)
 
         self.loaded_files = []
+        self.arrow_mode = tk.BooleanVar(value=False)
+        self.compact_mode = tk.BooleanVar(value=False)
         self.selected_option = None
         self.insert_label = None
         self.bug_icon = None
@@ -89,10 +95,35 @@ class DataCleaningApp:
             )
             btn.grid(row=r, column=c, padx=5, pady=5, sticky="ew")
 
+        tk.Checkbutton(
+            options_frame,
+            text="Modo Arrow (menos memoria en columnas de texto)",
+            variable=self.arrow_mode,
+            font=self.text_font,
+            fg="white",
+            bg="#1A1A1A",
+            selectcolor="#1A1A1A",
+            activebackground="#1A1A1A",
+            activeforeground="white"
+        ).grid(row=2, column=0, pady=(5, 0))
+        tk.Checkbutton(
+            options_frame,
+            text="Compactar memoria tras depurar",
+            variable=self.compact_mode,
+            font=self.text_font,
+            fg="white",
+            bg="#1A1A1A",
+            selectcolor="#1A1A1A",
+            activebackground="#1A1A1A",
+            activeforeground="white"
+        ).grid(row=2, column=1, pady=(5, 0))
+
         # Cargar imagen si existe (para evitar errores en otras PCs)
         img_path = "image 1.png"
         if os.path.exists(img_path):
             try:
+                # PIL solo se importa si hay imagen que mostrar
+                from PIL import Image, ImageTk
                 image = Image.open(img_path)
                 image = image.resize((100, 100), Image.Resampling.LANCZOS)
                 self.bug_icon = ImageTk.PhotoImage(image)
@@ -130,6 +161,16 @@ class DataCleaningApp:
         )
         self.insert_label.place(relx=0.5, rely=0.5, anchor="center")
 
+        tk.Button(
+            insert_frame,
+            text="Cargar carpeta",
+            font=self.text_font,
+            bg="white",
+            fg="black",
+            relief="flat",
+            command=self.load_folder
+        ).pack(anchor="e", pady=(5, 0))
+
         self.insert_text_frame.bind("<Button-1>", lambda e: self.load_files())
         self.insert_label.bind("<Button-1>", lambda e: self.load_files())
 
@@ -149,28 +190,85 @@ class DataCleaningApp:
             ("Excel", "*.xlsx *.xls"),
             ("Texto", "*.txt")
         ]
-        filename = filedialog.askopenfilename(title="Seleccionar archivo", filetypes=filetypes)
-        if filename:
-            self.loaded_files = [{"name": os.path.basename(filename), "path": filename}]
-            self.display_file()
+        filenames = filedialog.askopenfilenames(title="Seleccionar archivos", filetypes=filetypes)
+        if not filenames:
+            return
+        infos = [{"name": os.path.basename(f), "path": f} for f in filenames]
+        # con un solo libro Excel se pueden elegir sus hojas; en lote se usa la primera
+        if len(infos) == 1 and infos[0]["path"].lower().endswith((".xlsx", ".xls")):
+            infos[0]["hojas"] = self.select_sheets(infos[0]["path"])
+            if not infos[0]["hojas"]:
+                return
+        self.add_files(infos)
+
+    def load_folder(self):
+        from Depurador import expandir_rutas
+        folder = filedialog.askdirectory(title="Seleccionar carpeta")
+        if not folder:
+            return
+        paths = expandir_rutas([folder])
+        if not paths:
+            messagebox.showwarning("Carpeta vacía", "La carpeta no tiene archivos CSV, TXT, Excel o Parquet.")
+            return
+        self.add_files([{"name": os.path.basename(f), "path": f} for f in paths])
+
+    def add_files(self, infos):
+        known = {f["path"] for f in self.loaded_files}
+        self.loaded_files.extend(f for f in infos if f["path"] not in known)
+        self.display_file()
+
+    def select_sheets(self, path):
+        """Pide las hojas a cargar si el libro tiene más de una; devuelve la lista elegida."""
+        from Depurador import hojas_excel
+        try:
+            hojas = hojas_excel(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo abrir el libro:\n{e}")
+            return []
+        if len(hojas) <= 1:
+            return hojas
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Seleccionar hojas")
+        dialog.configure(bg="#1A1A1A")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        tk.Label(dialog, text="Hojas a cargar:", font=self.text_font, fg="white", bg="#1A1A1A").pack(padx=10, pady=(10, 5))
+        lista = tk.Listbox(dialog, selectmode="multiple", height=min(len(hojas), 12), exportselection=False)
+        for h in hojas:
+            lista.insert("end", h)
+        lista.selection_set(0)
+        lista.pack(fill="both", expand=True, padx=10, pady=5)
+
+        elegidas = []
+        def aceptar():
+            elegidas.extend(hojas[i] for i in lista.curselection())
+            dialog.destroy()
+        tk.Button(dialog, text="Aceptar", font=self.button_font, command=aceptar).pack(pady=(5, 10))
+        dialog.wait_window()
+        return elegidas
 
     def display_file(self):
         for w in self.files_container.winfo_children():
             w.destroy()
-        if self.loaded_files:
-            info = self.loaded_files[0]
+        if not self.loaded_files:
+            self.clear_file()
+            return
+        for i, info in enumerate(self.loaded_files):
             frame = tk.Frame(self.files_container, bg="#1A1A1A")
-            frame.pack(fill="both", expand=True, padx=10, pady=10)
+            frame.pack(fill="x", padx=10, pady=(10 if i == 0 else 2, 2))
             icon = tk.Canvas(frame, width=30, height=30, bg="#1A1A1A", highlightthickness=0)
             icon.create_rectangle(6, 4, 24, 28, fill="#f0f0f0")
             icon.pack(side="left", padx=5)
-            tk.Label(
+            info["label"] = tk.Label(
                 frame,
-                text=info["name"],
+                text=info["name"] + (f" ({', '.join(info['hojas'])})" if len(info.get("hojas", [])) > 1 else ""),
                 font=self.text_font,
                 fg="white",
-                bg="#1A1A1A"
-            ).pack(side="left", fill="both", expand=True)
+                bg="#1A1A1A",
+                anchor="w"
+            )
+            info["label"].pack(side="left", fill="both", expand=True)
             tk.Button(
                 frame,
                 text="×",
@@ -178,9 +276,24 @@ class DataCleaningApp:
                 fg="white",
                 bg="#1A1A1A",
                 bd=0,
-                command=self.clear_file
+                command=lambda i=i: self.remove_file(i)
             ).pack(side="right", padx=5)
-            self.insert_label.place_forget()
+
+    def remove_file(self, index):
+        del self.loaded_files[index]
+        self.display_file()
+
+    def set_file_status(self, status):
+        """Muestra el estado y el tiempo de un archivo procesado en lote junto a su nombre."""
+        for info in self.loaded_files:
+            if info["path"] == status["archivo"] and info.get("label") is not None:
+                ok = status["estado"] == "ok"
+                detail = f"{status['filas']:,} filas".replace(",", ".") if ok else status["estado"]
+                info["label"].configure(
+                    text=f"{info['name']}  —  {'✓' if ok else '✗'} {detail}, {status['segundos']:.1f} s",
+                    fg="#7CFC00" if ok else "#FF6B6B"
+                )
+        self.root.update_idletasks()
 
     def open_dashboard(self):
         """Carga/depura los datos y abre el Dashboard con el dataset listo."""
@@ -189,27 +302,36 @@ class DataCleaningApp:
                 messagebox.showwarning("Sin archivo", "Por favor, carga un archivo primero.")
                 return
 
-            from Depurador import cargar_datos, depurar_dataframe
-            src_path = self.loaded_files[0]["path"]
-            df = cargar_datos(src_path)
-            if df is None or df.empty:
-                messagebox.showerror("Error", "No se pudo cargar el dataset o está vacío.")
-                return
-
-            df_clean = depurar_dataframe(df)
-
-            tmp_csv = os.path.join(tempfile.gettempdir(), "dataset_depurado_dashboard.csv")
-            try:
-                df_clean.to_csv(tmp_csv, index=False, encoding="utf-8")
-            except Exception:
-                df_clean.to_csv(tmp_csv, index=False, encoding="latin-1")
+            from Depurador import cargar_binario, compactar_dataframe, depurar_archivos, guardar_binario
+            if len(self.loaded_files) > 1:
+                df_clean = self.process_batch(depurar_archivos)
+                if df_clean is None:
+                    return
+                if self.compact_mode.get():
+                    df_clean = compactar_dataframe(df_clean)
+                if self.on_open is not None:
+                    self.on_open(df_clean, ", ".join(f["name"] for f in self.loaded_files))
+                    return
+                # formato binario tipado: el Dashboard lo abre sin volver a parsear y con los dtypes depurados
+                tmp_path = guardar_binario(df_clean, os.path.join(tempfile.gettempdir(), "dataset_depurado_dashboard"))
+            else:
+                # el dataset depurado sale de la caché si el archivo no ha cambiado
+                from cache_io import cached_clean
+                tmp_path = cached_clean(self.loaded_files[0]["path"], hojas=self.loaded_files[0].get("hojas"),
+                                        dtype_backend=self.dtype_backend(), compactar=self.compact_mode.get())
+                if tmp_path is None:
+                    messagebox.showerror("Error", "No se pudo cargar el dataset o está vacío.")
+                    return
+                if self.on_open is not None:
+                    self.on_open(cargar_binario(tmp_path), self.loaded_files[0]["path"])
+                    return
 
             here = os.path.dirname(os.path.abspath(__file__))
             dashboard_updated = os.path.join(here, "Dashboard_updated.py")
             dashboard_fallback = os.path.join(here, "Dashboard.py")
             dashboard_path = dashboard_updated if os.path.exists(dashboard_updated) else dashboard_fallback
 
-            subprocess.Popen([sys.executable, dashboard_path, tmp_csv])
+            subprocess.Popen([sys.executable, dashboard_path, str(tmp_path)])
 
             self.root.destroy()
 
@@ -218,6 +340,26 @@ class DataCleaningApp:
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un problema al abrir el dashboard:\n{e}")
 
+    def dtype_backend(self):
+        return "pyarrow" if self.arrow_mode.get() else None
+
+    def process_batch(self, depurar_archivos):
+        """Depura todos los archivos cargados en un pool de procesos y muestra el estado de cada uno."""
+        self.root.config(cursor="watch")
+        self.root.update()
+        try:
+            df, statuses = depurar_archivos([f["path"] for f in self.loaded_files],
+                                            on_archivo=self.set_file_status, dtype_backend=self.dtype_backend())
+        finally:
+            self.root.config(cursor="")
+        lines = [f"{os.path.basename(s['archivo'])}: {s['estado']} ({s['segundos']:.1f} s)" for s in statuses]
+        if df is None or df.empty:
+            messagebox.showerror("Error", "No se pudo cargar ningún archivo.\n\n" + "\n".join(lines))
+            return None
+        messagebox.showinfo("Lote depurado",
+                            f"Filas resultantes: {len(df):,}".replace(",", ".") + "\n\n" + "\n".join(lines))
+        return df
+
     def clear_file(self):
         self.loaded_files = []
         for w in self.files_container.winfo_children():
@@ -0,0 +1,100 @@
+"""
+Aplicación completa en un solo proceso: login -> carga -> dashboard.
+Las vistas se cambian dentro del mismo intérprete (sin subprocess ni archivo
+temporal para el dataset) y los módulos pesados se importan al entrar en la
+vista que los usa; mientras se muestra el login se precargan en segundo plano.
+Uso: python app.py [--sin-precarga] [--medir]
+"""
+import importlib
+import sys
+import threading
+import time
+import tkinter as tk
+
+T0 = time.perf_counter()
+
+# módulos que solo se necesitan tras el login, en el orden en que se usan.
+# customtkinter no se precarga: al importarse toca Tk y debe hacerlo en el hilo principal
+PRECARGA = ("numpy", "pandas", "pyarrow", "Depurador", "cache_io", "PIL.ImageTk",
+            "matplotlib.figure", "matplotlib.backends.backend_tkagg")
+
+
+def precargar(modulos=PRECARGA) -> threading.Thread:
+    """Importa 'modulos' en un hilo en segundo plano; los que falten se ignoran."""
+    def _importar():
+        for nombre in modulos:
+            try:
+                importlib.import_module(nombre)
+            except Exception:
+                # el error real se verá al usarlo en su vista
+                pass
+
+    hilo = threading.Thread(target=_importar, name="precarga", daemon=True)
+    hilo.start()
+    return hilo
+
+
+class AppShell:
+    def __init__(self, precarga: bool = True, medir: bool = False):
+        self.root = tk.Tk()
+        self.medir = medir
+        self._dashboard = None
+        if precarga:
+            precargar()
+        self.show_login()
+        if medir:
+            self.root.after_idle(lambda: self._marca("login visible"))
+
+    def _marca(self, vista: str):
+        print(f"{vista}: {time.perf_counter() - T0:.2f} s desde el inicio", file=sys.stderr)
+
+    def _limpiar(self):
+        for w in self.root.winfo_children():
+            w.destroy()
+        self.root.unbind("<Configure>")
+
+    def show_login(self):
+        from Login import LoginWindow
+        self._limpiar()
+        LoginWindow(self.root, on_login=self.show_loader)
+
+    def show_loader(self):
+        t = time.perf_counter()
+        from Main import DataCleaningApp
+        self._limpiar()
+        DataCleaningApp(self.root, on_open=self.show_dashboard)
+        if self.medir:
+            print(f"carga: vista lista en {time.perf_counter() - t:.2f} s", file=sys.stderr)
+
+    def show_dashboard(self, df, nombre=None):
+        # el Dashboard es su propia ventana CTk: se cierra la raíz tk y run() lo abre
+        # al salir del mainloop, con el DataFrame en memoria
+        self._dashboard = (df, nombre)
+        self.root.destroy()
+
+    def run(self):
+        self.root.mainloop()
+        if self._dashboard is None:
+            return
+        df, nombre = self._dashboard
+        self._dashboard = None
+
+        t = time.perf_counter()
+        from Dashboard import DataDebuggerApp
+        app = DataDebuggerApp()
+        app.measure_refresh = self.medir
+        app.df = df
+        app.last_file = nombre
+        app.show_page("Dashboard")
+        if self.medir:
+            print(f"dashboard: vista lista en {time.perf_counter() - t:.2f} s", file=sys.stderr)
+        app.mainloop()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    AppShell(precarga="--sin-precarga" not in argv, medir="--medir" in argv).run()
+
+
+if __name__ == "__main__":
+    main()
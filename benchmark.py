@@ -0,0 +1,219 @@
+"""
+Benchmarks antes/después de las optimizaciones de Depurador.py.
+Uso: python benchmark.py [filas] [columnas]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from Depurador import (VACIOS, cargar_datos, columnas_texto, depurar_dataframe,
+                       normalizar_texto, ruta_esquema)
+
+
+def _medir(fn, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def frame_ancho(filas=200_000, columnas=40, semilla=0) -> pd.DataFrame:
+    """Frame sintético de texto: mitad de columnas de baja cardinalidad y mitad de alta."""
+    rng = np.random.default_rng(semilla)
+    ciudades = np.array([" Bogotá", "Cali ", "Medellín", "Neiva", "NA", "", "-", "NULL"], dtype=object)
+    datos = {}
+    for i in range(columnas):
+        if i % 2 == 0:
+            datos[f"cat_{i}"] = ciudades[rng.integers(0, len(ciudades), filas)]
+        else:
+            ids = rng.integers(0, filas, filas).astype(str)
+            datos[f"txt_{i}"] = np.char.add(" id", ids).astype(object)
+    return pd.DataFrame(datos, dtype=object)
+
+
+def _pasos_1_2_antes(df: pd.DataFrame) -> pd.DataFrame:
+    # implementación original de depurar_dataframe, pasos 1 y 2
+    df = df.copy()
+    for c in df.columns:
+        if df[c].dtype == "O":
+            df[c] = df[c].replace(list(VACIOS), np.nan)
+    for c in df.select_dtypes(include=["object", "string"]).columns:
+        df[c] = df[c].astype(str).str.strip().replace({"": np.nan, "nan": np.nan})
+    return df
+
+
+def _pasos_1_2_despues(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for c in columnas_texto(df):
+        df[c] = normalizar_texto(df[c])
+    return df
+
+
+def bench_normalizacion(filas=200_000, columnas=40):
+    df = frame_ancho(filas, columnas)
+    antes = _medir(lambda: _pasos_1_2_antes(df))
+    despues = _medir(lambda: _pasos_1_2_despues(df))
+    print(f"Normalización pasos 1-2 ({filas:,} x {columnas}):")
+    print(f"  antes:   {antes:8.3f} s")
+    print(f"  después: {despues:8.3f} s  ({antes / despues:.1f}x)")
+
+
+def bench_arrow(filas=200_000, columnas=40):
+    """Memoria y tiempo de cargar_datos + depurar_dataframe: columnas object vs Arrow."""
+    ruta = os.path.join(tempfile.gettempdir(), "bench_depurador.csv")
+    frame_ancho(filas, columnas).to_csv(ruta, index=False)
+    print(f"Carga + depuración object vs Arrow ({filas:,} x {columnas}):")
+    try:
+        for backend in (None, "pyarrow"):
+            # sin esquema guardado, para medir también la inferencia
+            ruta_esquema(ruta).unlink(missing_ok=True)
+            t0 = time.perf_counter()
+            df = cargar_datos(ruta, dtype_backend=backend)
+            t1 = time.perf_counter()
+            mem_carga = df.memory_usage(deep=True).sum() / 1024 / 1024
+            limpio = depurar_dataframe(df)
+            t2 = time.perf_counter()
+            mem_limpio = limpio.memory_usage(deep=True).sum() / 1024 / 1024
+            print(f"  {backend or 'object':8s} carga {t1 - t0:6.2f} s  {mem_carga:8.1f} MB | "
+                  f"depuración {t2 - t1:6.2f} s  {mem_limpio:8.1f} MB")
+    finally:
+        ruta_esquema(ruta).unlink(missing_ok=True)
+        os.remove(ruta)
+
+
+def _arranque_en_frio(codigo: str, repeticiones=3):
+    """
+    Mejor tiempo de un intérprete nuevo que ejecuta 'codigo' (solo imports, sin
+    ventana), o None si falla (p. ej. falta una dependencia de la interfaz).
+    """
+    aqui = os.path.dirname(os.path.abspath(__file__))
+    try:
+        return _medir(lambda: subprocess.run([sys.executable, "-c", codigo], cwd=aqui, check=True,
+                                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
+                      repeticiones)
+    except subprocess.CalledProcessError:
+        return None
+
+
+def bench_arranque():
+    """
+    Arranque antes (Login -> Main -> Dashboard, un intérprete nuevo por ventana,
+    Main con pandas y PIL al importar) y después (app.py: un solo intérprete,
+    imports diferidos a la vista que los usa).
+    """
+    def fmt(t):
+        return "   n/d  " if t is None else f"{t:6.2f} s"
+
+    antes = {
+        "login": _arranque_en_frio("import Login"),
+        "carga": _arranque_en_frio("import pandas, PIL.ImageTk, Main"),
+        "dashboard": _arranque_en_frio("import Dashboard"),
+    }
+    despues = {
+        "login": _arranque_en_frio("import app, Login"),
+        "carga": _arranque_en_frio("import app, Login, Main"),
+        "dashboard": _arranque_en_frio("import app, Login, Main, Dashboard"),
+    }
+    print("Arranque de la interfaz (imports en intérpretes nuevos; n/d = falta una dependencia):")
+    print("  antes (un proceso por ventana, tiempo de cada una):")
+    print("    " + " | ".join(f"{k} {fmt(v)}" for k, v in antes.items()))
+    print("  después (un solo proceso, tiempo acumulado hasta cada vista):")
+    print("    " + " | ".join(f"{k} {fmt(v)}" for k, v in despues.items()))
+
+
+def bench_graficos(refrescos=20, filas=1_000_000):
+    """
+    Coste de refrescar los cinco gráficos del Dashboard: antes (plt.subplots y un
+    canvas nuevo por gráfico en cada refresco, sin cerrar las figuras) y después
+    (una figura por gráfico, actualizada en sitio). Se dibuja con Agg, sin ventana.
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        print("Refresco de gráficos: n/d (falta matplotlib)")
+        return
+
+    rng = np.random.default_rng(0)
+    valores = rng.normal(size=filas)
+    barras = [(list("abcdefghij"), rng.random(10) * 100)] * 4
+    from Depurador import Histograma
+    hist = Histograma.de_serie(pd.Series(valores), bins=30)
+    counts, edges = hist.conteos, hist.bordes
+
+    def antes():
+        for etiquetas, alturas in barras:
+            fig, ax = plt.subplots(figsize=(4.5, 2.7))
+            ax.bar(etiquetas, alturas)
+            ax.tick_params(axis="x", rotation=30)
+            fig.tight_layout()
+            FigureCanvasAgg(fig).draw()
+        fig, ax = plt.subplots(figsize=(4.5, 2.7))
+        ax.hist(valores, bins=30)
+        fig.tight_layout()
+        FigureCanvasAgg(fig).draw()
+
+    figuras = []
+    for _ in range(5):
+        fig = Figure(figsize=(4.5, 2.7))
+        ax = fig.add_subplot()
+        figuras.append((fig, ax, FigureCanvasAgg(fig)))
+    rects = [list(ax.bar(range(10), alturas)) for (fig, ax, _), (_, alturas) in zip(figuras, barras)]
+    rects.append(list(figuras[4][1].bar(edges[:-1], counts, width=np.diff(edges), align="edge")))
+    for fig, _, _ in figuras:
+        fig.tight_layout()
+
+    def despues():
+        # el histograma se redibuja desde los conteos guardados en el perfil (Histograma)
+        for (fig, ax, canvas), rs, (_, alturas) in zip(figuras, rects, barras + [(None, counts)]):
+            for r, h in zip(rs, alturas):
+                r.set_height(h)
+            ax.relim()
+            ax.autoscale_view()
+            canvas.draw()
+
+    with matplotlib.rc_context({"figure.max_open_warning": 0}):
+        t_antes = _medir(lambda: [antes() for _ in range(refrescos)], 1) / refrescos
+    abiertas = len(plt.get_fignums())
+    plt.close("all")
+    t_despues = _medir(lambda: [despues() for _ in range(refrescos)], 1) / refrescos
+    print(f"Refresco de los 5 gráficos del Dashboard ({filas:,} valores en el histograma):")
+    print(f"  antes:   {t_antes * 1000:8.1f} ms/refresco, {abiertas} figuras abiertas tras {refrescos} refrescos")
+    print(f"  después: {t_despues * 1000:8.1f} ms/refresco ({t_antes / t_despues:.1f}x), 5 figuras en total")
+
+
+def bench_histograma(filas=5_000_000, bins=30):
+    """Binning de una columna grande: ax.hist (antes, en el hilo de Tk) vs Histograma por bloques."""
+    from Depurador import Histograma
+    s = pd.Series(np.random.default_rng(0).normal(size=filas))
+    s[::100] = np.nan
+    try:
+        from matplotlib.figure import Figure
+        ax = Figure().add_subplot()
+        antes = _medir(lambda: (ax.cla(), ax.hist(s.dropna(), bins=bins)))
+    except ImportError:
+        antes = None
+    despues = _medir(lambda: Histograma.de_serie(s, bins))
+    print(f"Histograma de {filas:,} valores ({bins} bins):")
+    print(f"  antes (ax.hist):     {'n/d' if antes is None else f'{antes:8.3f} s'}")
+    print(f"  después (Histograma): {despues:8.3f} s, calculado una vez en el perfil; cambiar de columna no re-binea")
+
+
+if __name__ == "__main__":
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    columnas = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    bench_normalizacion(filas, columnas)
+    bench_arrow(filas, columnas)
+    bench_arranque()
+    bench_graficos()
+    bench_histograma()
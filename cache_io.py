@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Caché en disco de datasets ya depurados, direccionada por contenido:
+# la clave es el hash del archivo de origen (o URL + tabla + marcador de cambios
+# para BD) más la configuración de depuración. Se limita por tamaño con LRU.
+CACHE_DIR = Path(os.environ.get("DEPURADOR_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "depurador_cache"))
+MAX_CACHE_BYTES = int(os.environ.get("DEPURADOR_CACHE_MAX_MB", "2048")) * 1024 * 1024
+# súbelo cuando cambie el resultado de depurar_dataframe para invalidar lo guardado
+CACHE_VERSION = 1
+_SUFFIXES = (".arrow", ".pkl")
+
+
+def file_digest(path, block_size: int = 1024 * 1024) -> str:
+    """Hash BLAKE2b del contenido del archivo, leído por bloques."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def make_key(source_id: str, config: dict = None) -> str:
+    """Clave de caché para un origen ya identificado y una configuración de depuración."""
+    payload = json.dumps({"source": source_id, "config": config or {}, "version": CACHE_VERSION},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def db_source_id(url: str, table: str = None, column: str = None) -> str:
+    """Identifica una tabla de BD: URL sin contraseña, tabla y marcador de cambios."""
+    from sqlalchemy.engine import make_url
+    from db_io import table_change_marker
+    table, marker = table_change_marker(url, table, column)
+    return f"{make_url(url).render_as_string(hide_password=True)}|{table}|{marker}"
+
+
+def lookup(key: str, cache_dir=None):
+    """Ruta del dataset guardado para 'key', o None. Un acierto lo marca como usado (LRU)."""
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    for suffix in _SUFFIXES:
+        path = cache_dir / f"{key}{suffix}"
+        if path.exists():
+            os.utime(path)
+            return path
+    return None
+
+
+def store(key: str, df, cache_dir=None, max_bytes: int = None) -> Path:
+    """Guarda el DataFrame para 'key' en formato binario y aplica el límite de tamaño."""
+    from Depurador import guardar_binario
+
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # se escribe con otro nombre y se renombra: un lector nunca ve un archivo a medias
+    tmp = guardar_binario(df, cache_dir / f"tmp-{key}-{os.getpid()}")
+    path = cache_dir / f"{key}{tmp.suffix}"
+    os.replace(tmp, path)
+    evict(max_bytes, cache_dir, keep=path)
+    return path
+
+
+def evict(max_bytes: int = None, cache_dir=None, keep=None):
+    """Borra los datasets usados hace más tiempo hasta quedar por debajo de max_bytes."""
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for path in cache_dir.iterdir():
+        if path.suffix in _SUFFIXES and not path.name.startswith("tmp-"):
+            st = path.stat()
+            entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        if keep is not None and path == Path(keep):
+            continue
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+
+
+def clear(cache_dir=None):
+    """Vacía la caché."""
+    evict(0, cache_dir)
+
+
+def cached_clean(source: str, hojas=None, dtype_backend=None, compactar: bool = False, cache_dir=None):
+    """
+    Devuelve la ruta del dataset depurado para 'source' (archivo o URL de BD),
+    cargando y depurando solo si no está en caché. Devuelve None si no se pudo cargar.
+    """
+    from Depurador import cargar_datos, depurar_dataframe
+
+    config = {"hojas": hojas, "dtype_backend": dtype_backend, "compactar": compactar}
+    if isinstance(source, str) and source.startswith(("mysql+", "oracle+")):
+        key = make_key(db_source_id(source), config)
+    else:
+        key = make_key(file_digest(source), config)
+
+    path = lookup(key, cache_dir)
+    if path is not None:
+        return path
+
+    df = cargar_datos(source, hojas=hojas, dtype_backend=dtype_backend)
+    if df is None or df.empty:
+        return None
+    df = depurar_dataframe(df, compactar=compactar)
+    return store(key, df, cache_dir)
@@ -0,0 +1,164 @@
+"""
+Depuración sin interfaz gráfica, para servidores sin pantalla y tareas de cron.
+
+Uso:
+    python cli.py ORIGEN [ORIGEN ...] -o SALIDA [opciones]
+
+ORIGEN puede ser un archivo (CSV, TXT, Excel, Parquet), una carpeta o una URL
+de base de datos (SQLAlchemy). El reporte de calidad se escribe en JSON por la
+salida estándar (o en --reporte); los mensajes de progreso van a stderr.
+Devuelve 0 si todo fue bien y 1 si no se pudo depurar el origen.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+FORMATOS = ("csv", "parquet", "arrow", "xlsx", "pkl")
+_EXTENSIONES = {".csv": "csv", ".txt": "csv", ".parquet": "parquet", ".arrow": "arrow",
+                ".feather": "arrow", ".xlsx": "xlsx", ".pkl": "pkl"}
+
+
+def _es_url(origen: str) -> bool:
+    return "://" in origen
+
+
+def formato_salida(salida, formato: str = None) -> str:
+    """Formato pedido, o el que indica la extensión de 'salida' (CSV por defecto)."""
+    if formato:
+        return formato
+    return _EXTENSIONES.get(Path(str(salida)).suffix.lower(), "csv")
+
+
+def guardar_salida(df, salida, formato: str):
+    """Escribe el DataFrame depurado en 'salida' con el formato indicado."""
+    if formato == "csv":
+        df.to_csv(salida, index=False)
+    elif formato == "parquet":
+        df.to_parquet(salida, index=False)
+    elif formato == "arrow":
+        df.reset_index(drop=True).to_feather(salida, compression="uncompressed")
+    elif formato == "xlsx":
+        df.to_excel(salida, index=False)
+    elif formato == "pkl":
+        df.to_pickle(salida)
+    else:
+        raise ValueError(f"Formato de salida no soportado: {formato}")
+
+
+def _cargar(args, backend):
+    """Carga y depura los orígenes. Devuelve (df, filas_origen, estados por archivo)."""
+    from Depurador import cargar_binario, cargar_datos, depurar_archivos, depurar_dataframe
+
+    origenes = args.origen
+    if len(origenes) == 1 and _es_url(origenes[0]):
+        from db_io import read_dataframe_from_db
+        df = read_dataframe_from_db(origenes[0], table=args.tabla, dtype_backend=backend)
+        return depurar_dataframe(df), len(df), None
+
+    if len(origenes) > 1 or os.path.isdir(origenes[0]):
+        df, estados = depurar_archivos(origenes, procesos=args.procesos, dtype_backend=backend)
+        return df, sum(e["filas"] for e in estados), estados
+
+    if args.cache:
+        from cache_io import cached_clean
+        ruta = cached_clean(origenes[0], hojas=args.hojas, dtype_backend=backend)
+        return (None, None, None) if ruta is None else (cargar_binario(ruta), None, None)
+
+    df = cargar_datos(origenes[0], hojas=args.hojas, dtype_backend=backend)
+    if df is None:
+        return None, None, None
+    return depurar_dataframe(df), len(df), None
+
+
+def _por_bloques(args):
+    """Modos --incremental y --bloques: escriben CSV sin cargar todo el origen en memoria."""
+    from Depurador import depurar_incremental, depurar_incremental_bd, depurar_por_bloques
+
+    origen = args.origen[0]
+    tam = args.bloques or 100_000
+    if args.incremental and _es_url(origen):
+        if not (args.tabla and args.columna):
+            raise ValueError("--incremental con una URL de BD requiere --tabla y --columna.")
+        return depurar_incremental_bd(origen, args.tabla, args.columna, args.salida, tam)
+    if args.incremental:
+        return depurar_incremental(origen, args.salida, tam, sep=args.sep)
+    return depurar_por_bloques(origen, args.salida, tam, sep=args.sep)
+
+
+def depurar(args) -> dict:
+    """Ejecuta la depuración descrita por 'args' y devuelve el reporte de calidad."""
+    from Depurador import compactar_dataframe, reporte_calidad
+
+    t0 = time.perf_counter()
+    formato = formato_salida(args.salida, args.formato)
+    reporte = {"origen": args.origen, "salida": str(args.salida), "formato": formato}
+
+    if args.incremental or args.bloques:
+        if len(args.origen) != 1 or formato != "csv":
+            raise ValueError("--incremental y --bloques trabajan con un solo origen y salida CSV.")
+        reporte.update(_por_bloques(args))
+    else:
+        backend = "pyarrow" if args.arrow else None
+        df, filas_origen, estados = _cargar(args, backend)
+        if df is None:
+            raise ValueError("No se pudo cargar el origen.")
+        if args.compactar:
+            df = compactar_dataframe(df)
+        guardar_salida(df, args.salida, formato)
+        reporte.update(reporte_calidad(df, filas_origen))
+        if estados is not None:
+            reporte["archivos"] = estados
+
+    reporte["segundos"] = round(time.perf_counter() - t0, 3)
+    return reporte
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Depura archivos, carpetas o tablas de BD sin interfaz gráfica.")
+    parser.add_argument("origen", nargs="+", help="archivo, carpeta o URL de base de datos")
+    parser.add_argument("-o", "--salida", required=True, help="archivo de salida")
+    parser.add_argument("-f", "--formato", choices=FORMATOS,
+                        help="formato de salida; por defecto según la extensión de --salida")
+    parser.add_argument("-r", "--reporte", help="archivo JSON para el reporte (por defecto, stdout)")
+    parser.add_argument("--tabla", help="tabla a leer si el origen es una URL de BD")
+    parser.add_argument("--hojas", nargs="+", help="hojas a leer si el origen es un libro Excel")
+    parser.add_argument("--sep", help="separador del CSV (por defecto se detecta)")
+    parser.add_argument("--arrow", action="store_true", help="columnas respaldadas por Arrow")
+    parser.add_argument("--compactar", action="store_true", help="reduce la memoria del resultado")
+    parser.add_argument("--procesos", type=int, help="procesos para depurar varios archivos")
+    parser.add_argument("--cache", action="store_true", help="reutiliza la caché de datasets depurados")
+    parser.add_argument("--bloques", type=int, metavar="FILAS",
+                        help="depura un CSV grande por bloques de FILAS filas")
+    parser.add_argument("--incremental", action="store_true",
+                        help="solo depura lo añadido desde la última ejecución y lo anexa a --salida")
+    parser.add_argument("--columna", help="columna creciente para --incremental sobre una tabla de BD")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = crear_parser().parse_args(argv)
+    try:
+        # las funciones de carga informan con print: se desvían a stderr para no mezclarlas con el JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            reporte = depurar(args)
+        codigo = 0
+    except Exception as e:
+        reporte = {"origen": args.origen, "error": str(e)}
+        codigo = 1
+
+    texto = json.dumps(reporte, ensure_ascii=False, indent=2, default=str)
+    if args.reporte:
+        with open(args.reporte, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# los módulos viven en la raíz del repositorio, no en un paquete
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,203 @@
+import shutil
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from db_io import (build_select, dispose_all_engines, iter_dataframe_from_db, iter_partitioned_from_db,
+                   migrate_table, read_dataframe_from_db, read_partitioned_from_db)
+
+COLUMNAS = ["id", "nombre"]
+FILTROS = [("edad", ">=", 18), ("ciudad", "=", None)]
+
+
+@pytest.mark.parametrize("dialecto, esperado, pendiente", [
+    ("mysql", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL LIMIT 5", None),
+    ("mariadb", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL LIMIT 5", None),
+    ("sqlite", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL LIMIT 5", None),
+    ("postgresql", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL LIMIT 5", None),
+    ("oracle", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL "
+               "FETCH FIRST 5 ROWS ONLY", None),
+    ("mssql", "SELECT TOP 5 id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL", None),
+    ("firebird", "SELECT id, nombre FROM personas WHERE edad >= :f0 AND ciudad IS NULL", 5),
+])
+def test_build_select_por_dialecto(dialecto, esperado, pendiente):
+    sql, params, limite = build_select(dialecto, "personas", columns=COLUMNAS, filters=FILTROS, limit=5)
+    assert sql == esperado
+    assert params == {"f0": 18}
+    assert limite == pendiente
+
+
+def test_build_select_desde_url_y_sin_limite():
+    sql, params, limite = build_select("oracle+cx_oracle://u:p@host:1521/?service_name=XE", "personas")
+    assert (sql, params, limite) == ("SELECT * FROM personas", {}, None)
+
+
+@pytest.mark.parametrize("dialecto, columna", [
+    ("mysql", "`nombre completo`"),
+    ("mariadb", "`nombre completo`"),
+    ("mssql", "[nombre completo]"),
+    ("postgresql", '"nombre completo"'),
+    ("oracle", '"nombre completo"'),
+])
+def test_build_select_cita_nombres_no_simples(dialecto, columna):
+    sql, _, _ = build_select(dialecto, "personas", columns=["nombre completo"], filters={"nombre completo": "x"})
+    assert sql == f"SELECT {columna} FROM personas WHERE {columna} = :f0"
+
+
+def test_build_select_envuelve_query():
+    sql, _, _ = build_select("sqlite", query="SELECT * FROM personas;", limit=2)
+    assert sql == "SELECT * FROM (SELECT * FROM personas) q LIMIT 2"
+
+
+def test_build_select_errores():
+    with pytest.raises(ValueError):
+        build_select("sqlite")
+    with pytest.raises(ValueError):
+        build_select("sqlite", "personas", filters=[("edad", "LIKE", "1%")])
+
+
+@pytest.fixture
+def url(tmp_path):
+    ruta = tmp_path / "personas.db"
+    with sqlite3.connect(ruta) as conn:
+        conn.execute("CREATE TABLE personas (id INTEGER, nombre TEXT, edad INTEGER, ciudad TEXT)")
+        conn.executemany("INSERT INTO personas VALUES (?, ?, ?, ?)", [
+            (1, "ana", 30, "Lima"), (2, "luis", 15, "Quito"), (3, "eva", 42, None),
+            (4, "juan", 18, "Lima"), (5, "sara", 25, "Cusco"),
+        ])
+    yield f"sqlite:///{ruta}"
+    dispose_all_engines()
+
+
+def test_read_dataframe_from_db_empuja_columnas_filtros_y_limite(url):
+    df = read_dataframe_from_db(url, "personas", columns=COLUMNAS, filters=[("edad", ">=", 18)], limit=2)
+    assert list(df.columns) == COLUMNAS
+    assert df["id"].tolist() == [1, 3]
+
+    df = read_dataframe_from_db(url, "personas", filters={"ciudad": None})
+    assert df["nombre"].tolist() == ["eva"]
+
+    df = read_dataframe_from_db(url, query="SELECT * FROM personas WHERE ciudad = 'Lima'", columns=["nombre"])
+    assert df["nombre"].tolist() == ["ana", "juan"]
+
+
+def test_iter_dataframe_from_db_por_bloques(url):
+    filas = []
+    bloques = list(iter_dataframe_from_db(url, "personas", chunksize=2, columns=["id", "edad"],
+                                          filters=[("edad", ">", 16)], limit=3, on_rows=filas.append))
+    assert [len(b) for b in bloques] == [2, 1]
+    assert filas == [2, 3]
+    df = pd.concat(bloques, ignore_index=True)
+    assert list(df.columns) == ["id", "edad"]
+    assert df["id"].tolist() == [1, 3, 4]
+
+
+@pytest.fixture
+def url_particiones(tmp_path):
+    ruta = tmp_path / "eventos.db"
+    with sqlite3.connect(ruta) as conn:
+        conn.execute("CREATE TABLE eventos (id INTEGER PRIMARY KEY, fecha TEXT, puntos INTEGER)")
+        # ids no contiguos y un rango que no se divide exacto: los bordes se redondean
+        conn.executemany("INSERT INTO eventos VALUES (?, ?, ?)", [
+            (i * 3 + 1, f"2024-01-{i % 28 + 1:02d}T10:{i % 60:02d}:00", None if i % 5 == 0 else i % 7)
+            for i in range(37)
+        ])
+    yield f"sqlite:///{ruta}"
+    dispose_all_engines()
+
+
+@pytest.mark.parametrize("columna, particiones", [
+    (None, 4),        # clave primaria entera
+    ("id", 7),
+    ("fecha", 5),     # fechas ISO guardadas como texto: los extremos deben ser los de la BD
+    ("puntos", 3),    # con nulos: van a la partición extra
+    ("puntos", 20),   # más particiones que valores distintos
+])
+def test_particiones_sin_perder_ni_repetir_filas(url_particiones, columna, particiones):
+    completo = read_dataframe_from_db(url_particiones, "eventos").sort_values("id", ignore_index=True)
+    partes = list(iter_partitioned_from_db(url_particiones, "eventos", columna, particiones))
+    # la partición de nulos llega como object: se comparan con los dtypes de la lectura completa
+    leidas = pd.concat(partes).astype(completo.dtypes.to_dict()).sort_values("id", ignore_index=True)
+    # ids únicos en la tabla: mismas filas sin pérdidas ni repetidas
+    pd.testing.assert_frame_equal(leidas, completo)
+
+    df = read_partitioned_from_db(url_particiones, "eventos", columna, particiones, max_workers=2)
+    assert sorted(df["id"]) == completo["id"].tolist()
+
+
+def test_particiones_incluyen_extremos_y_nulos(url_particiones):
+    partes = list(iter_partitioned_from_db(url_particiones, "eventos", "puntos", 3))
+    # la última partición es la de nulos; el mínimo y el máximo caen en la primera y la penúltima
+    assert partes[-1]["puntos"].isna().all() and len(partes[-1]) == 8
+    assert partes[0]["puntos"].min() == 0
+    assert partes[-2]["puntos"].max() == 6
+
+
+class Corte(Exception):
+    pass
+
+
+def _tabla_origen(tmp_path, con_clave: bool) -> str:
+    ruta = tmp_path / "origen.db"
+    with sqlite3.connect(ruta) as conn:
+        clave = "INTEGER PRIMARY KEY" if con_clave else "INTEGER"
+        conn.execute(f"CREATE TABLE ventas (id {clave}, producto TEXT)")
+        # sin clave, filas repetidas: deben copiarse tantas veces como estén
+        filas = [(i, f"p{i % 4}") for i in range(1, 24)] + ([] if con_clave else [(5, "p1"), (5, "p1")])
+        conn.executemany("INSERT INTO ventas VALUES (?, ?)", filas)
+    return f"sqlite:///{ruta}"
+
+
+def _filas(url: str, tabla: str) -> list:
+    return sorted(read_dataframe_from_db(url, tabla).itertuples(index=False, name=None))
+
+
+@pytest.mark.parametrize("con_clave", [True, False])
+def test_migrate_table_se_reanuda_tras_un_corte(tmp_path, con_clave):
+    src = _tabla_origen(tmp_path, con_clave)
+    dst = f"sqlite:///{tmp_path / 'destino.db'}"
+    checkpoint = tmp_path / "migracion.json"
+
+    def cortar(filas, _):
+        if filas >= 10:
+            raise Corte()
+
+    try:
+        with pytest.raises(Corte):
+            migrate_table(src, dst, "ventas", batch_size=4, checkpoint=checkpoint, on_progress=cortar)
+        assert checkpoint.exists()
+
+        res = migrate_table(src, dst, "ventas", batch_size=4, checkpoint=checkpoint)
+        assert _filas(dst, "tabla_migrada") == _filas(src, "ventas")
+        assert res["rows"] == len(_filas(src, "ventas"))
+        assert res["copied"] < res["rows"]
+        assert not checkpoint.exists()
+    finally:
+        dispose_all_engines()
+
+
+@pytest.mark.parametrize("con_clave", [True, False])
+def test_migrate_table_no_duplica_un_lote_confirmado_sin_checkpoint(tmp_path, con_clave):
+    # corte entre el commit de un lote y el guardado del checkpoint: el checkpoint
+    # queda un lote por detrás del destino
+    src = _tabla_origen(tmp_path, con_clave)
+    dst = f"sqlite:///{tmp_path / 'destino.db'}"
+    checkpoint = tmp_path / "migracion.json"
+    anterior = tmp_path / "anterior.json"
+
+    def cortar(filas, _):
+        if filas == 4:
+            shutil.copy(checkpoint, anterior)
+        if filas >= 8:
+            raise Corte()
+
+    try:
+        with pytest.raises(Corte):
+            migrate_table(src, dst, "ventas", batch_size=4, checkpoint=checkpoint, on_progress=cortar)
+        shutil.copy(anterior, checkpoint)
+
+        migrate_table(src, dst, "ventas", batch_size=4, checkpoint=checkpoint)
+        assert _filas(dst, "tabla_migrada") == _filas(src, "ventas")
+    finally:
+        dispose_all_engines()
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from Depurador import (IndiceFilas, compactar_dataframe, depurar_dataframe, depurar_incremental,
+                       depurar_por_bloques, leer_csv)
+
+
+def test_depurar_por_bloques_detecta_duplicados_con_dtypes_distintos(tmp_path):
+    # el primer bloque lee 'id' como int64 y el segundo como texto (por la 'x')
+    origen = tmp_path / "datos.csv"
+    origen.write_text("id,v\n1,a\n2,b\n3,c\nx,d\n1,a\n2,b\n", encoding="utf-8")
+    salida = tmp_path / "limpio.csv"
+
+    resumen = depurar_por_bloques(origen, salida, tam_bloque=3)
+
+    completo = depurar_dataframe(pd.read_csv(origen))
+    limpio = pd.read_csv(salida)
+    assert len(limpio) == len(completo) == 4
+    assert resumen["duplicados"] == 2
+    assert limpio["v"].tolist() == ["a", "b", "c", "d"]
+
+
+def test_depurar_incremental_no_repite_filas_al_ampliar_dtypes(tmp_path):
+    origen = tmp_path / "datos.csv"
+    salida = tmp_path / "limpio.csv"
+    origen.write_text("id,v\n1,a\n2,b\n", encoding="utf-8")
+    depurar_incremental(origen, salida)
+
+    # la 'y' obliga a releer 'id' sin los dtypes guardados
+    with open(origen, "a", encoding="utf-8") as f:
+        f.write("y,e\n1,a\n")
+    resumen = depurar_incremental(origen, salida)
+    assert resumen["duplicados"] == 1
+
+    with open(origen, "a", encoding="utf-8") as f:
+        f.write("4,f\n2,b\n")
+    resumen = depurar_incremental(origen, salida)
+    assert resumen["duplicados"] == 1
+
+    lineas = salida.read_text(encoding="utf-8").splitlines()
+    assert lineas == ["id,v", "1.0,a", "2.0,b", ",e", "4.0,f"]
+
+
+def test_compactar_dataframe_con_enteros_nulables_vacios():
+    df = pd.DataFrame({"a": pd.array([None, None], dtype="Int64"),
+                       "b": pd.array([None, None], dtype="UInt8"), "c": [1, 2]})
+    compacto = compactar_dataframe(df)
+    assert compacto["a"].isna().all() and compacto["b"].isna().all()
+    assert compacto["c"].tolist() == [1, 2]
+
+
+def test_esquema_guardado_no_borra_texto_nuevo_en_columna_numerica(tmp_path):
+    origen = tmp_path / "datos.csv"
+    origen.write_text('id;importe\n1;"1,5"\n2;"2,25"\n3;"3,0"\n', encoding="utf-8")
+    depurar_dataframe(leer_csv(origen))  # guarda el esquema: importe es "numerico"
+
+    # misma cabecera, pero ahora la columna trae texto
+    origen.write_text("id;importe\n1;alto\n2;bajo\n3;medio\n", encoding="utf-8")
+    df = depurar_dataframe(leer_csv(origen))
+    assert df["importe"].tolist() == ["alto", "bajo", "medio"]
+
+
+def test_indice_filas_con_columnas_object_de_tipos_mezclados():
+    df = pd.DataFrame({"a": pd.Series([1, "1", True, "True", 1.0, 2.5, None, None], dtype=object)})
+    indice = IndiceFilas(df)
+    assert indice.duplicadas().tolist() == df.duplicated().tolist()
+    assert indice.sin_duplicados(df).equals(df.drop_duplicates())